@@ -0,0 +1,48 @@
+"""Result-file helpers shared by compare-benchmark.py and convert-e2e-results.py."""
+
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+# Result files are small and reads are latency-bound, so keep one read in flight per
+# file (up to this cap) rather than the executor's CPU-based default.
+MAX_CONCURRENT_READS = 128
+
+
+def find_result_files(results_dir: Path, framework: str = "abies") -> list[Path]:
+    """Find all result JSON files for the specified framework."""
+    if not results_dir.is_dir():
+        return []
+    with os.scandir(results_dir) as entries:
+        names = [
+            e.name for e in entries
+            if e.name.startswith(framework) and e.name.endswith(".json") and e.is_file()
+        ]
+    return [results_dir / name for name in sorted(names)]
+
+
+def parse_result_files(parse: Callable[[Path, list[str]], T], result_files: list[Path]) -> list[T]:
+    """Apply parse to every result file concurrently, keeping file order.
+
+    parse appends its warnings to the list it is given instead of printing them from a
+    worker thread; they are written to stderr here, in file order.
+    """
+    if not result_files:
+        return []
+
+    def parse_collecting_warnings(file_path: Path) -> tuple[T, list[str]]:
+        warnings: list[str] = []
+        return parse(file_path, warnings), warnings
+
+    results = []
+    with ThreadPoolExecutor(max_workers=min(len(result_files), MAX_CONCURRENT_READS)) as executor:
+        for result, warnings in executor.map(parse_collecting_warnings, result_files):
+            for warning in warnings:
+                print(warning, file=sys.stderr)
+            results.append(result)
+    return results
+
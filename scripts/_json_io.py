@@ -0,0 +1,65 @@
+"""JSON load/dump shared by the benchmark scripts, using orjson when it is installed."""
+
+import json
+import mmap
+import os
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # Optional speed-up; the stdlib parser is always available
+    orjson = None
+
+# Below this size a single read() is cheaper than setting up a memory map
+MMAP_THRESHOLD = 64 * 1024
+
+
+def decode_json(raw: bytes):
+    """Decode a JSON document held in memory."""
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def encode_json(data, compact: bool = False, ensure_ascii: bool = True) -> bytes:
+    """Encode data as UTF-8 JSON bytes.
+
+    Output is indented for people to read unless compact is set, which suits files
+    that are only consumed by other tools. ensure_ascii only affects the stdlib
+    encoder; orjson never escapes non-ASCII characters.
+    """
+    if orjson:
+        return orjson.dumps(data) if compact else orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    if compact:
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=ensure_ascii).encode()
+    return json.dumps(data, indent=2, ensure_ascii=ensure_ascii).encode()
+
+
+def load_json(file_path: Path, missing_ok: bool = False):
+    """Decode a JSON file.
+
+    With missing_ok, a missing or empty file returns None instead of raising, using
+    the one open() rather than a separate exists()/stat() check. With orjson, files
+    above MMAP_THRESHOLD are memory-mapped and parsed in place instead of being
+    copied into a bytes object first.
+    """
+    try:
+        f = open(file_path, "rb")
+    except FileNotFoundError:
+        if missing_ok:
+            return None
+        raise
+
+    with f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0 and missing_ok:
+            return None
+        if orjson is None:
+            return json.loads(f.read())
+        if size <= MMAP_THRESHOLD:
+            return orjson.loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
+
+
+def dump_json(file_path: Path, data, compact: bool = False) -> None:
+    """Write data as JSON, serialized once and written as bytes in one call."""
+    Path(file_path).write_bytes(encode_json(data, compact=compact))
@@ -26,37 +26,76 @@ import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Tuple, List, Dict
 
-# Patterns for identifying failure types
+# Patterns for identifying failure types.
+# '.' never crosses a newline, so every pattern matches within a single line; wildcards
+# are lazy so each attempt stops at the first terminator instead of running to the end
+# of the line and backtracking.
 TIMEOUT_PATTERNS = [
     r'TimeoutException',
-    r'Timeout.*exceeded',
-    r'timeout.*ms',
-    r'waiting for.*timed out',
+    r'Timeout.*?exceeded',
+    r'timeout.*?ms',
+    r'waiting for.*?timed out',
     r'Timeout \d+ms exceeded',
-    r'Page\..*\(\).*Timeout',
-    r'locator.*timeout',
+    r'Page\..*?\(\).*?Timeout',
+    r'locator.*?timeout',
 ]
 
 ASSERTION_PATTERNS = [
-    r'Expected.*but.*got',
-    r'Expected.*to.*but',
+    r'Expected.*?but.*?got',
+    r'Expected.*?to.*?but',
     r'Assert\.',
     r'AssertionException',
-    r'ToBeVisible.*failed',
-    r'ToHaveText.*failed',
-    r'ToContain.*failed',
+    r'ToBeVisible.*?failed',
+    r'ToHaveText.*?failed',
+    r'ToContain.*?failed',
     r'Expected true but was false',
     r'Expected false but was true',
 ]
 
+# Each category is compiled once into a single alternation so a failure's text is
+# scanned once per category instead of once per pattern. Patterns are matched
+# against lowercased text, so they are lowercased here instead of using
+# re.IGNORECASE (avoid escapes whose meaning depends on case, e.g. \D or \S).
+TIMEOUT_RE = re.compile("|".join(f"(?:{p.lower()})" for p in TIMEOUT_PATTERNS))
+ASSERTION_RE = re.compile("|".join(f"(?:{p.lower()})" for p in ASSERTION_PATTERNS))
+
+# Lowercase substrings that every pattern in the matching category contains, used
+# to skip the regex for text that can't match. Checked below at import time.
+TIMEOUT_HINTS = ("timeout", "timed out")
+ASSERTION_HINTS = ("expected", "assert", "tobe", "tohave", "tocontain")
+
+
+def _check_hints(patterns: List[str], hints: Tuple[str, ...], category: str) -> None:
+    """Raise if a pattern contains none of its category's hints, since the prefilter would hide every match"""
+    for pattern in patterns:
+        if not any(hint in pattern.lower() for hint in hints):
+            raise ValueError(f"{category} pattern {pattern!r} contains none of {hints}; add a matching hint")
+
+
+_check_hints(TIMEOUT_PATTERNS, TIMEOUT_HINTS, "Timeout")
+_check_hints(ASSERTION_PATTERNS, ASSERTION_HINTS, "Assertion")
+
+# Fully-qualified TRX tag names. Output sits directly under UnitTestResult, ErrorInfo
+# under Output, and Message/StackTrace under ErrorInfo, so plain child lookups suffice.
+TRX_NAMESPACE = 'http://microsoft.com/schemas/VisualStudio/TeamTest/2010'
+RESULT_TAG = f'{{{TRX_NAMESPACE}}}UnitTestResult'
+OUTPUT_TAG = f'{{{TRX_NAMESPACE}}}Output'
+ERROR_INFO_TAG = f'{{{TRX_NAMESPACE}}}ErrorInfo'
+MESSAGE_TAG = f'{{{TRX_NAMESPACE}}}Message'
+STACK_TRACE_TAG = f'{{{TRX_NAMESPACE}}}StackTrace'
+
 
 class TestResult:
     """Represents a single test result"""
+    __slots__ = ("name", "outcome", "message", "stack_trace", "summary", "failure_type")
+    
     def __init__(self, name: str, outcome: str, message: str = "", stack_trace: str = ""):
         self.name = name
         self.outcome = outcome
         self.message = message
         self.stack_trace = stack_trace
+        # First 300 chars of the message, as shown in failure reports
+        self.summary = message[:300] + "..." if len(message) > 300 else message
         self.failure_type = self._categorize_failure()
     
     def _categorize_failure(self) -> str:
@@ -65,16 +104,15 @@ class TestResult:
             return "passed"
         
         combined_text = f"{self.message} {self.stack_trace}"
+        lower = combined_text.lower()
         
         # Check for timeouts first (they might include assertions in waiting code)
-        for pattern in TIMEOUT_PATTERNS:
-            if re.search(pattern, combined_text, re.IGNORECASE):
-                return "timeout"
+        if any(hint in lower for hint in TIMEOUT_HINTS) and TIMEOUT_RE.search(lower):
+            return "timeout"
         
         # Check for assertions
-        for pattern in ASSERTION_PATTERNS:
-            if re.search(pattern, combined_text, re.IGNORECASE):
-                return "assertion"
+        if any(hint in lower for hint in ASSERTION_HINTS) and ASSERTION_RE.search(lower):
+            return "assertion"
         
         # Unknown failure type
         return "unknown"
@@ -84,95 +122,113 @@ class TestResult:
         return f"{status} {self.name} [{self.failure_type}]"
 
 
-def parse_trx_file(trx_path: Path) -> Tuple[List[TestResult], Dict[str, int]]:
-    """Parse TRX file and extract test results"""
-    try:
-        tree = ET.parse(trx_path)
-        root = tree.getroot()
-    except Exception as e:
-        print(f"❌ Error parsing TRX file: {e}")
-        sys.exit(2)
+def _record_result(result_elem: ET.Element, results: List[TestResult], counts: Dict[str, int]) -> None:
+    """Count one UnitTestResult and keep a TestResult for it if the test did not pass"""
+    outcome = result_elem.get('outcome', 'Unknown')
+    counts['total'] += 1
     
-    # TRX files use namespaces
-    ns = {'vs': 'http://microsoft.com/schemas/VisualStudio/TeamTest/2010'}
+    # Passed tests only contribute to the counts; skip building a result for them
+    if outcome == 'Passed':
+        counts['passed'] += 1
+        return
     
-    results = []
+    name = result_elem.get('testName', 'Unknown')
     
-    # Find all UnitTestResult elements
-    for result_elem in root.findall('.//vs:UnitTestResult', ns):
-        name = result_elem.get('testName', 'Unknown')
-        outcome = result_elem.get('outcome', 'Unknown')
-        
-        # Extract error message and stack trace
-        message = ""
-        stack_trace = ""
-        
-        output_elem = result_elem.find('.//vs:Output', ns)
-        if output_elem is not None:
-            error_info = output_elem.find('.//vs:ErrorInfo', ns)
-            if error_info is not None:
-                message_elem = error_info.find('.//vs:Message', ns)
-                if message_elem is not None and message_elem.text:
-                    message = message_elem.text
-                
-                stack_elem = error_info.find('.//vs:StackTrace', ns)
-                if stack_elem is not None and stack_elem.text:
-                    stack_trace = stack_elem.text
-        
-        results.append(TestResult(name, outcome, message, stack_trace))
+    # Extract error message and stack trace
+    message = ""
+    stack_trace = ""
+    
+    output_elem = result_elem.find(OUTPUT_TAG)
+    if output_elem is not None:
+        error_info = output_elem.find(ERROR_INFO_TAG)
+        if error_info is not None:
+            message_elem = error_info.find(MESSAGE_TAG)
+            if message_elem is not None and message_elem.text:
+                message = message_elem.text
+            
+            stack_elem = error_info.find(STACK_TRACE_TAG)
+            if stack_elem is not None and stack_elem.text:
+                stack_trace = stack_elem.text
+    
+    result = TestResult(name, outcome, message, stack_trace)
+    results.append(result)
     
     # Count outcomes
-    counts = {
-        'total': len(results),
-        'passed': sum(1 for r in results if r.outcome == 'Passed'),
-        'failed': sum(1 for r in results if r.outcome == 'Failed'),
-        'timeout': sum(1 for r in results if r.failure_type == 'timeout'),
-        'assertion': sum(1 for r in results if r.failure_type == 'assertion'),
-        'unknown': sum(1 for r in results if r.failure_type == 'unknown'),
-    }
+    if outcome == 'Failed':
+        counts['failed'] += 1
+    counts[result.failure_type] += 1
+
+
+def parse_trx_file(trx_path: Path) -> Tuple[List[TestResult], Dict[str, int]]:
+    """Parse TRX file and extract results for tests that did not pass, plus outcome counts"""
+    results = []
+    counts = {'total': 0, 'passed': 0, 'failed': 0, 'timeout': 0, 'assertion': 0, 'unknown': 0}
+    
+    # Stream the file instead of building the whole tree first. Every entry of a
+    # top-level section (Results, TestDefinitions, TestEntries, ...) is dropped from
+    # its section as soon as it closes, so memory stays bounded by one entry rather
+    # than growing with the number of tests.
+    depth = 0
+    section = None
+    for event, elem in ET.iterparse(trx_path, events=("start", "end")):
+        if event == "start":
+            depth += 1
+            if depth == 2:
+                section = elem
+            continue
+        
+        depth -= 1
+        if elem.tag == RESULT_TAG:
+            _record_result(elem, results, counts)
+            # Inner (data-driven) results are cleared here; their parent is still open
+            elem.clear()
+        if depth == 2:
+            del section[:]
     
     return results, counts
 
 
-def print_summary(counts: Dict[str, int]):
-    """Print test summary"""
-    print("\n" + "="*70)
-    print("📊 E2E Test Results Summary")
-    print("="*70)
-    print(f"Total Tests:       {counts['total']}")
-    print(f"✅ Passed:         {counts['passed']}")
-    print(f"❌ Failed:         {counts['failed']}")
+def format_summary(counts: Dict[str, int]) -> str:
+    """Format test summary"""
+    lines = [
+        "",
+        "="*70,
+        "📊 E2E Test Results Summary",
+        "="*70,
+        f"Total Tests:       {counts['total']}",
+        f"✅ Passed:         {counts['passed']}",
+        f"❌ Failed:         {counts['failed']}",
+    ]
     if counts['failed'] > 0:
-        print(f"   ⏱️  Timeouts:    {counts['timeout']}")
-        print(f"   🐛 Assertions:  {counts['assertion']}")
-        print(f"   ❓ Unknown:     {counts['unknown']}")
-    print("="*70 + "\n")
+        lines.append(f"   ⏱️  Timeouts:    {counts['timeout']}")
+        lines.append(f"   🐛 Assertions:  {counts['assertion']}")
+        lines.append(f"   ❓ Unknown:     {counts['unknown']}")
+    lines.append("="*70)
+    lines.append("")
+    return "\n".join(lines) + "\n"
 
 
-def print_failures(results: List[TestResult], failure_type: str = None):
-    """Print detailed failure information"""
+def format_failures(results: List[TestResult], failure_type: str = None) -> str:
+    """Format detailed failure information"""
     failures = [r for r in results if r.outcome != 'Passed']
     
     if failure_type:
         failures = [f for f in failures if f.failure_type == failure_type]
     
     if not failures:
-        return
+        return ""
     
     type_label = f" ({failure_type})" if failure_type else ""
-    print(f"\n{'='*70}")
-    print(f"Failed Tests{type_label}")
-    print('='*70)
+    lines = ["", '='*70, f"Failed Tests{type_label}", '='*70]
     
     for result in failures:
-        print(f"\n❌ {result.name}")
-        print(f"   Type: {result.failure_type}")
-        if result.message:
-            # Print first 300 chars of message
-            msg = result.message[:300]
-            if len(result.message) > 300:
-                msg += "..."
-            print(f"   Message: {msg}")
+        lines.append("")
+        lines.append(f"❌ {result.name}")
+        lines.append(f"   Type: {result.failure_type}")
+        if result.summary:
+            lines.append(f"   Message: {result.summary}")
+    
+    return "\n".join(lines) + "\n"
 
 
 def parse_args() -> argparse.Namespace:
@@ -205,36 +261,36 @@ def normalize_rate(value: float) -> float:
     return value
 
 
-def main():
-    args = parse_args()
-    trx_path = Path(args.trx_file)
-    strict_mode = args.strict
-    min_pass_rate = normalize_rate(args.min_pass_rate)
-    max_timeout_rate = normalize_rate(args.max_timeout_rate)
+def analyze(
+    trx_path: Path,
+    strict_mode: bool = False,
+    min_pass_rate: float = 0.0,
+    max_timeout_rate: float = 1.0,
+) -> int:
+    """Analyze a TRX file and return the exit code.
 
-    if min_pass_rate < 0.0 or min_pass_rate > 1.0:
-        print(f"❌ Invalid --min-pass-rate: {args.min_pass_rate} (expected 0..1 or 0..100)")
-        sys.exit(2)
-
-    if max_timeout_rate < 0.0 or max_timeout_rate > 1.0:
-        print(f"❌ Invalid --max-timeout-rate: {args.max_timeout_rate} (expected 0..1 or 0..100)")
-        sys.exit(2)
-    
+    Rates are ratios in [0..1]. Separate from main() so a long-running driver can
+    analyze many files in one process instead of spawning one per file.
+    """
     if not trx_path.exists():
         print(f"❌ Test results file not found: {trx_path}")
-        sys.exit(2)
+        return 2
     
     print(f"🔍 Analyzing E2E test results from: {trx_path}")
     print(f"   Mode: {'STRICT (fail on any error)' if strict_mode else 'LENIENT (warn on timeouts)'}")
     print(f"   Thresholds: min_pass_rate={min_pass_rate:.2%}, max_timeout_rate={max_timeout_rate:.2%}")
     
-    results, counts = parse_trx_file(trx_path)
+    try:
+        results, counts = parse_trx_file(trx_path)
+    except (ET.ParseError, OSError) as e:
+        print(f"❌ Error parsing TRX file: {e}")
+        return 2
     
-    print_summary(counts)
+    sys.stdout.write(format_summary(counts))
     
     if counts['total'] == 0:
         print("❌ No test results found in TRX file")
-        sys.exit(2)
+        return 2
 
     pass_rate = counts['passed'] / counts['total']
     timeout_rate = counts['timeout'] / counts['total']
@@ -245,29 +301,26 @@ def main():
         print("🎯 Decision")
         print("="*70)
         print(f"🚨 FAIL: Pass rate {pass_rate:.2%} is below required {min_pass_rate:.2%}")
-        sys.exit(1)
+        return 1
 
     if timeout_rate > max_timeout_rate:
         print("\n" + "="*70)
         print("🎯 Decision")
         print("="*70)
         print(f"🚨 FAIL: Timeout rate {timeout_rate:.2%} exceeds allowed {max_timeout_rate:.2%}")
-        sys.exit(1)
+        return 1
 
     # All tests passed
     if counts['failed'] == 0:
         print("✅ All E2E tests passed!")
-        sys.exit(0)
+        return 0
     
     # Print failure details
-    if counts['assertion'] > 0:
-        print_failures(results, 'assertion')
-    
-    if counts['timeout'] > 0:
-        print_failures(results, 'timeout')
-    
-    if counts['unknown'] > 0:
-        print_failures(results, 'unknown')
+    sys.stdout.write("".join(
+        format_failures(results, failure_type)
+        for failure_type in ('assertion', 'timeout', 'unknown')
+        if counts[failure_type] > 0
+    ))
     
     # Decision logic
     print("\n" + "="*70)
@@ -278,30 +331,46 @@ def main():
     if counts['assertion'] > 0:
         print(f"🚨 FAIL: Found {counts['assertion']} assertion failure(s)")
         print("   These are genuine test failures that must be fixed.")
-        sys.exit(1)
+        return 1
     
     # Unknown failures fail safe
     if counts['unknown'] > 0:
         print(f"❓ FAIL: Found {counts['unknown']} unclassified failure(s)")
         print("   Failing build to be safe. Manual investigation needed.")
-        sys.exit(1)
+        return 1
     
     # Only timeout failures
     if counts['timeout'] > 0:
         if strict_mode:
             print(f"⚠️  FAIL: Found {counts['timeout']} timeout failure(s) (strict mode)")
             print("   Timeouts fail in strict mode.")
-            sys.exit(1)
+            return 1
         else:
             print(f"⚠️  WARN: Found {counts['timeout']} timeout failure(s)")
             print("   Timeouts are often infrastructure issues (slow CI, network delays).")
             print("   Treated as warnings in lenient mode. Build passes.")
             print("\n💡 Tip: Run with --strict to fail on timeouts.")
-            sys.exit(0)
+            return 0
     
     # Should not reach here
     print("❓ Unexpected state. Failing to be safe.")
-    sys.exit(1)
+    return 1
+
+
+def main():
+    args = parse_args()
+    min_pass_rate = normalize_rate(args.min_pass_rate)
+    max_timeout_rate = normalize_rate(args.max_timeout_rate)
+
+    if min_pass_rate < 0.0 or min_pass_rate > 1.0:
+        print(f"❌ Invalid --min-pass-rate: {args.min_pass_rate} (expected 0..1 or 0..100)")
+        sys.exit(2)
+
+    if max_timeout_rate < 0.0 or max_timeout_rate > 1.0:
+        print(f"❌ Invalid --max-timeout-rate: {args.max_timeout_rate} (expected 0..1 or 0..100)")
+        sys.exit(2)
+
+    sys.exit(analyze(Path(args.trx_file), args.strict, min_pass_rate, max_timeout_rate))
 
 
 if __name__ == '__main__':
@@ -20,10 +20,14 @@ import json
 import os
 import statistics
 import sys
+from operator import attrgetter
 from pathlib import Path
 from dataclasses import dataclass
 from typing import Optional
 
+from _e2e_common import find_result_files, parse_result_files
+from _json_io import dump_json, load_json
+
 
 @dataclass
 class BenchmarkResult:
@@ -32,7 +36,6 @@ class BenchmarkResult:
     median: float
     mean: float
     std_dev: float  # Will be 0.0 if not available
-    values: list[float]
 
 
 @dataclass
@@ -46,18 +49,33 @@ class Comparison:
     is_improvement: bool
 
 
-def find_result_files(results_dir: Path, framework: str = "abies") -> list[Path]:
-    """Find all result JSON files for the specified framework."""
-    pattern = f"{framework}*.json"
-    files = list(results_dir.glob(pattern))
-    return sorted(files)
+def summarize(values: list[float]) -> tuple[float, float, float]:
+    """Compute (median, mean, std_dev) for raw samples, reusing the mean for std_dev."""
+    if not values:
+        return 0.0, 0.0, 0.0
+    mean = statistics.fmean(values)
+    std_dev = statistics.stdev(values, xbar=mean) if len(values) > 1 else 0.0
+    return statistics.median(values), mean, std_dev
+
+
+def extract_stats(metric) -> tuple[float, float, float]:
+    """Extract (median, mean, std_dev) from a metric entry in a result file."""
+    if isinstance(metric, dict):
+        # The stats object has pre-computed values
+        values = metric.get("values", [])
+        median = metric.get("median") or (statistics.median(values) if values else 0.0)
+        mean = metric.get("mean") or (statistics.fmean(values) if values else 0.0)
+        std_dev = metric.get("stddev") or (statistics.stdev(values) if len(values) > 1 else 0.0)
+        return median, mean, std_dev
 
+    # Legacy format: values is directly an array
+    return summarize(metric if isinstance(metric, list) else [])
 
-def parse_result_file(file_path: Path) -> Optional[BenchmarkResult]:
-    """Parse a single benchmark result file."""
+
+def parse_result_file(file_path: Path, warnings: list[str]) -> Optional[BenchmarkResult]:
+    """Parse a single benchmark result file, appending any warnings to warnings."""
     try:
-        with open(file_path) as f:
-            data = json.load(f)
+        data = load_json(file_path)
 
         # js-framework-benchmark format for CPU benchmarks:
         # {
@@ -73,50 +91,22 @@ def parse_result_file(file_path: Path) -> Optional[BenchmarkResult]:
         # Memory benchmarks use "DEFAULT" key instead of "total"
         if "values" in data:
             values_obj = data["values"]
-            values = []
-            median = 0.0
-            mean = 0.0
-            std_dev = 0.0
-
-            # Handle nested format (CPU benchmarks)
-            if isinstance(values_obj, dict):
-                # Use "total" timing as the primary metric for CPU benchmarks
-                if "total" in values_obj:
-                    total_data = values_obj["total"]
-                    # The stats object has pre-computed values
-                    if isinstance(total_data, dict):
-                        values = total_data.get("values", [])
-                        median = total_data.get("median") or (statistics.median(values) if values else 0.0)
-                        mean = total_data.get("mean") or (statistics.mean(values) if values else 0.0)
-                        std_dev = total_data.get("stddev") or (statistics.stdev(values) if len(values) > 1 else 0.0)
-                    else:
-                        # Legacy format: values is directly an array
-                        values = total_data if isinstance(total_data, list) else []
-                        median = statistics.median(values) if values else 0.0
-                        mean = statistics.mean(values) if values else 0.0
-                        std_dev = statistics.stdev(values) if len(values) > 1 else 0.0
-                elif "DEFAULT" in values_obj:
-                    # Memory/startup benchmarks use DEFAULT key
-                    default_data = values_obj["DEFAULT"]
-                    if isinstance(default_data, dict):
-                        values = default_data.get("values", [])
-                        median = default_data.get("median") or (statistics.median(values) if values else 0.0)
-                        mean = default_data.get("mean") or (statistics.mean(values) if values else 0.0)
-                        std_dev = default_data.get("stddev") or (statistics.stdev(values) if len(values) > 1 else 0.0)
-                    else:
-                        values = default_data if isinstance(default_data, list) else []
-                        median = statistics.median(values) if values else 0.0
-                        mean = statistics.mean(values) if values else 0.0
-                        std_dev = statistics.stdev(values) if len(values) > 1 else 0.0
-                else:
-                    print(f"Warning: Unknown values format in {file_path}", file=sys.stderr)
+
+            match values_obj:
+                # Handle nested format (CPU benchmarks)
+                # Use "total" timing as the primary metric for CPU benchmarks;
+                # memory/startup benchmarks use the DEFAULT key
+                case {"total": metric} | {"DEFAULT": metric}:
+                    pass
+                case dict():
+                    warnings.append(f"Warning: Unknown values format in {file_path}")
                     return None
-            else:
-                # Legacy format: values is directly an array
-                values = values_obj
-                median = statistics.median(values)
-                mean = statistics.mean(values)
-                std_dev = statistics.stdev(values) if len(values) > 1 else 0.0
+                case _:
+                    # Legacy format: values is directly an array
+                    metric = values_obj
+
+            # extract_stats handles both the stats object and the raw sample array
+            median, mean, std_dev = extract_stats(metric)
 
             # Ensure std_dev is never None
             if std_dev is None:
@@ -131,10 +121,9 @@ def parse_result_file(file_path: Path) -> Optional[BenchmarkResult]:
                 median=float(median) if median is not None else 0.0,
                 mean=float(mean) if mean is not None else 0.0,
                 std_dev=float(std_dev) if std_dev is not None else 0.0,
-                values=values if isinstance(values, list) else []
             )
     except (json.JSONDecodeError, KeyError, IndexError) as e:
-        print(f"Warning: Could not parse {file_path}: {e}", file=sys.stderr)
+        warnings.append(f"Warning: Could not parse {file_path}: {e}")
 
     return None
 
@@ -169,8 +158,7 @@ def save_baseline(baseline_path: Path, results: dict[str, BenchmarkResult]) -> N
         }
     }
 
-    with open(baseline_path, "w") as f:
-        json.dump(data, f, indent=2)
+    dump_json(baseline_path, data)
 
     print(f"✅ Baseline saved to {baseline_path}")
 
@@ -204,13 +192,13 @@ def compare_results(
 
 
 def format_comparison_table(comparisons: list[Comparison]) -> str:
-    """Format comparison results as a markdown table."""
+    """Format comparison results as a markdown table, in the order given."""
     lines = [
         "| Benchmark | Baseline | Current | Diff | Status |",
         "|-----------|----------|---------|------|--------|",
     ]
 
-    for comp in sorted(comparisons, key=lambda c: c.name):
+    for comp in comparisons:
         if comp.is_regression:
             status = "🔴 REGRESSION"
         elif comp.is_improvement:
@@ -272,8 +260,7 @@ def main():
 
     # Parse results
     results: dict[str, BenchmarkResult] = {}
-    for file_path in result_files:
-        result = parse_result_file(file_path)
+    for result in parse_result_files(parse_result_file, result_files):
         if result:
             results[result.name] = result
 
@@ -304,6 +291,7 @@ def main():
         sys.exit(0)
 
     comparisons = compare_results(results, baseline, args.threshold)
+    comparisons.sort(key=attrgetter("name"))
 
     if not comparisons:
         print("⚠️  No matching benchmarks to compare")
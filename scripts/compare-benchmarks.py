@@ -24,14 +24,17 @@ Exit codes:
 """
 
 import argparse
-import json
+import bisect
 import sys
 from pathlib import Path
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import Optional
 
+from _json_io import load_json
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class BenchmarkComparison:
     """Result of comparing a single benchmark between baseline and PR."""
     name: str
@@ -46,13 +49,10 @@ class BenchmarkComparison:
 
 def load_throughput_metrics(merged_dir: Path) -> dict[str, float]:
     """Load throughput metrics from merged BenchmarkDotNet format."""
-    file_path = merged_dir / 'throughput.json'
-    if not file_path.exists():
+    data = load_json(merged_dir / 'throughput.json', missing_ok=True)
+    if data is None:
         return {}
 
-    with open(file_path, 'r') as f:
-        data = json.load(f)
-
     metrics = {}
     for benchmark in data.get('Benchmarks', []):
         name = benchmark.get('Method', 'Unknown')
@@ -66,13 +66,10 @@ def load_throughput_metrics(merged_dir: Path) -> dict[str, float]:
 
 def load_allocation_metrics(merged_dir: Path) -> dict[str, float]:
     """Load allocation metrics from customSmallerIsBetter format."""
-    file_path = merged_dir / 'allocations.json'
-    if not file_path.exists():
+    data = load_json(merged_dir / 'allocations.json', missing_ok=True)
+    if data is None:
         return {}
 
-    with open(file_path, 'r') as f:
-        data = json.load(f)
-
     metrics = {}
     for item in data:
         name = item.get('name', 'Unknown')
@@ -96,23 +93,22 @@ def compare_metrics(
 
     Both cases use ratio = PR / Baseline, and ratio > threshold means failure.
     """
-    results = []
+    if not baseline or not pr:
+        return []
 
-    # Find common benchmarks
-    common_names = set(baseline.keys()) & set(pr.keys())
-
-    for name in sorted(common_names):
-        baseline_val = baseline[name]
-        pr_val = pr[name]
+    results = []
 
-        if baseline_val <= 0:
-            continue  # Skip invalid baselines
+    # Benchmarks present in both runs; results are unordered, and
+    # print_comparison_table sorts them for display.
+    for name, pr_val in pr.items():
+        baseline_val = baseline.get(name)
+        if baseline_val is None or baseline_val <= 0:
+            continue  # Skip missing or invalid baselines
 
         ratio = pr_val / baseline_val
-        ratio_percent = ratio * 100
 
         # Regression if ratio exceeds threshold (e.g., 110% = 10% slower/more)
-        passed = ratio_percent <= threshold_percent
+        passed = ratio * 100 <= threshold_percent
 
         results.append(BenchmarkComparison(
             name=name,
@@ -128,70 +124,81 @@ def compare_metrics(
     return results
 
 
+# Unit scales for format_value: (divisor, suffix, format) per magnitude, selected with
+# bisect over the lower bounds of every scale but the first.
+UNIT_SCALES = {
+    'ns': (
+        [1_000, 1_000_000, 1_000_000_000],
+        [(1, 'ns', '{:.2f}'), (1_000, 'μs', '{:.2f}'), (1_000_000, 'ms', '{:.2f}'), (1_000_000_000, 's', '{:.2f}')],
+    ),
+    'bytes': (
+        [1024, 1_048_576, 1_073_741_824],  # 1 KiB, 1 MiB, 1 GiB
+        [(1, 'B', '{:.0f}'), (1024, 'KiB', '{:.2f}'), (1_048_576, 'MiB', '{:.2f}'), (1_073_741_824, 'GiB', '{:.2f}')],
+    ),
+}
+
+
 def format_value(value: float, unit: str) -> str:
     """Format a benchmark value with appropriate units."""
-    if unit == 'ns':
-        if value >= 1_000_000_000:
-            return f"{value / 1_000_000_000:.2f} s"
-        elif value >= 1_000_000:
-            return f"{value / 1_000_000:.2f} ms"
-        elif value >= 1_000:
-            return f"{value / 1_000:.2f} μs"
-        else:
-            return f"{value:.2f} ns"
-    elif unit == 'bytes':
-        if value >= 1_073_741_824:  # 1 GiB
-            return f"{value / 1_073_741_824:.2f} GiB"
-        elif value >= 1_048_576:  # 1 MiB
-            return f"{value / 1_048_576:.2f} MiB"
-        elif value >= 1024:  # 1 KiB
-            return f"{value / 1024:.2f} KiB"
-        else:
-            return f"{value:.0f} B"
-    else:
+    scales = UNIT_SCALES.get(unit)
+    if scales is None:
         return f"{value:.2f} {unit}"
 
+    edges, steps = scales
+    divisor, suffix, fmt = steps[bisect.bisect_right(edges, value)]
+    return f"{fmt.format(value / divisor)} {suffix}"
+
 
 def print_comparison_table(comparisons: list[BenchmarkComparison], title: str) -> tuple[int, int]:
-    """Print a comparison table and return (passed_count, failed_count)."""
+    """Print a comparison table sorted by name and return (passed_count, failed_count)."""
     if not comparisons:
         print(f"\n{title}: No benchmarks to compare")
         return 0, 0
 
-    print(f"\n{'='*80}")
-    print(f"{title}")
-    print(f"{'='*80}")
+    # One bound formatter for the header, separator and every row
+    format_row = "{:<40} {:>12} {:>12} {:>10} {:>8}".format
 
-    # Header
-    print(f"{'Benchmark':<40} {'Baseline':>12} {'PR':>12} {'Change':>10} {'Status':>8}")
-    print(f"{'-'*40} {'-'*12} {'-'*12} {'-'*10} {'-'*8}")
+    lines = [
+        "",
+        '='*80,
+        title,
+        '='*80,
+        # Header
+        format_row('Benchmark', 'Baseline', 'PR', 'Change', 'Status'),
+        format_row('-'*40, '-'*12, '-'*12, '-'*10, '-'*8),
+    ]
 
     passed = 0
     failed = 0
 
-    for comp in comparisons:
-        baseline_str = format_value(comp.baseline_value, comp.unit)
-        pr_str = format_value(comp.pr_value, comp.unit)
+    for comp in sorted(comparisons, key=attrgetter('name')):
+        name, unit, ratio, ok = comp.name, comp.unit, comp.ratio, comp.passed
+        baseline_str = format_value(comp.baseline_value, unit)
+        pr_str = format_value(comp.pr_value, unit)
 
         # Calculate percentage change
-        change_percent = (comp.ratio - 1) * 100
+        change_percent = (ratio - 1) * 100
         if change_percent >= 0:
             change_str = f"+{change_percent:.1f}%"
         else:
             change_str = f"{change_percent:.1f}%"
 
-        status = "✓ PASS" if comp.passed else "✗ FAIL"
+        status = "✓ PASS" if ok else "✗ FAIL"
 
         # Truncate long names
-        name = comp.name[:38] + '..' if len(comp.name) > 40 else comp.name
+        if len(name) > 40:
+            name = name[:38] + '..'
 
-        print(f"{name:<40} {baseline_str:>12} {pr_str:>12} {change_str:>10} {status:>8}")
+        lines.append(format_row(name, baseline_str, pr_str, change_str, status))
 
-        if comp.passed:
+        if ok:
             passed += 1
         else:
             failed += 1
 
+    # Emit the whole table with a single write
+    sys.stdout.write("\n".join(lines) + "\n")
+
     return passed, failed
 
 
@@ -12,23 +12,45 @@ Usage:
 
 import argparse
 import json
+import statistics
 import sys
+from operator import itemgetter
 from pathlib import Path
 from datetime import datetime
 
+from _e2e_common import find_result_files, parse_result_files
+from _json_io import dump_json, load_json
 
-def find_result_files(results_dir: Path, framework: str) -> list[Path]:
-    """Find all result JSON files for the specified framework."""
-    pattern = f"{framework}*.json"
-    files = list(results_dir.glob(pattern))
-    return sorted(files)
 
+def summarize(values: list[float]) -> tuple[float, float]:
+    """Compute (median, mean) for raw samples; both are 0 when there are none."""
+    if not values:
+        return 0, 0
+    return statistics.median(values), statistics.fmean(values)
 
-def parse_result_file(file_path: Path) -> dict | None:
-    """Parse a single js-framework-benchmark result file."""
+
+def extract_stats(metric) -> tuple[list, float, float]:
+    """Extract (values, median, mean) from a metric entry in a result file."""
+    if isinstance(metric, dict):
+        values = metric.get("values", [])
+        median = metric.get("median")
+        mean = metric.get("mean")
+        # Only fall back to the raw samples when the stats aren't pre-computed
+        if median is None or mean is None:
+            sample_median, sample_mean = summarize(values)
+            median = sample_median if median is None else median
+            mean = sample_mean if mean is None else mean
+        return values, median, mean
+
+    # Legacy format: the metric is the raw sample array
+    values = metric if isinstance(metric, list) else []
+    return (values, *summarize(values))
+
+
+def parse_result_file(file_path: Path, warnings: list[str]) -> dict | None:
+    """Parse a single js-framework-benchmark result file, appending any warnings to warnings."""
     try:
-        with open(file_path) as f:
-            data = json.load(f)
+        data = load_json(file_path)
 
         if "values" not in data:
             return None
@@ -37,39 +59,20 @@ def parse_result_file(file_path: Path) -> dict | None:
         if not values_obj:
             return None
 
-        # Handle nested format (CPU benchmarks)
-        # Format: {"total": {"min": ..., "values": [...]}, "script": {...}, "paint": {...}}
-        if isinstance(values_obj, dict):
-            # Use "total" timing as the primary metric
-            if "total" in values_obj:
-                total_data = values_obj["total"]
-                if isinstance(total_data, dict):
-                    values = total_data.get("values", [])
-                    median = total_data.get("median", sorted(values)[len(values) // 2] if values else 0)
-                    mean = total_data.get("mean", sum(values) / len(values) if values else 0)
-                else:
-                    values = total_data if isinstance(total_data, list) else []
-                    median = sorted(values)[len(values) // 2] if values else 0
-                    mean = sum(values) / len(values) if values else 0
-            elif "DEFAULT" in values_obj:
-                # Memory/startup benchmarks use DEFAULT key
-                default_data = values_obj["DEFAULT"]
-                if isinstance(default_data, dict):
-                    values = default_data.get("values", [])
-                    median = default_data.get("median", sorted(values)[len(values) // 2] if values else 0)
-                    mean = default_data.get("mean", sum(values) / len(values) if values else 0)
-                else:
-                    values = default_data if isinstance(default_data, list) else []
-                    median = sorted(values)[len(values) // 2] if values else 0
-                    mean = sum(values) / len(values) if values else 0
-            else:
-                print(f"Warning: Unknown values format in {file_path}", file=sys.stderr)
+        match values_obj:
+            # Nested format (CPU benchmarks)
+            # Format: {"total": {"min": ..., "values": [...]}, "script": {...}, "paint": {...}}
+            # Use "total" timing as the primary metric; memory/startup benchmarks use the DEFAULT key
+            case {"total": metric} | {"DEFAULT": metric}:
+                pass
+            case dict():
+                warnings.append(f"Warning: Unknown values format in {file_path}")
                 return None
-        else:
-            # Legacy format: values is directly an array
-            values = values_obj
-            median = sorted(values)[len(values) // 2]
-            mean = sum(values) / len(values)
+            case _:
+                # Legacy format: values is directly an array
+                metric = values_obj
+
+        values, median, mean = extract_stats(metric)
 
         # Extract benchmark name from filename
         # Format: framework_benchmarkname.json or framework-version_benchmarkname.json
@@ -85,19 +88,63 @@ def parse_result_file(file_path: Path) -> dict | None:
             "name": benchmark_name,
             "median": median,
             "mean": mean,
-            "values": values if isinstance(values, list) else [],
+            "samples": len(values) if isinstance(values, list) else 0,
         }
     except (json.JSONDecodeError, KeyError, IndexError) as e:
-        print(f"Warning: Could not parse {file_path}: {e}", file=sys.stderr)
+        warnings.append(f"Warning: Could not parse {file_path}: {e}")
         return None
 
 
+# Human-readable descriptions for all benchmarks
+BENCHMARK_DESCRIPTIONS = {
+    # CPU benchmarks (01-09)
+    "01_run1k": "create 1000 rows",
+    "02_replace1k": "replace all 1000 rows",
+    "03_update10th1k": "update every 10th row",
+    "04_select1k": "select row",
+    "05_swap1k": "swap two rows",
+    "06_remove-one-1k": "remove one row",
+    "07_create10k": "create 10,000 rows",
+    "08_create1k-after1k_x2": "append 1000 rows",
+    "09_clear1k": "clear all rows",
+    # Memory benchmarks (21-26)
+    "21_ready-memory": "ready memory",
+    "22_run-memory": "run memory",
+    "23_update5-memory": "update5 memory",
+    "24_replace5-memory": "replace5 memory",
+    "25_clear-memory": "clear memory",
+    "26_run-clear-memory": "run-clear memory",
+    # Startup benchmarks (31-34)
+    "31_startup-ci": "startup time",
+    "32_startup-bt": "script bootup time",
+    "33_startup-mainthreadcost": "main thread work cost",
+    "34_startup-totalbytes": "total byte weight",
+}
+
+# Chart names per benchmark, built once: "01_run1k (create 1000 rows)"
+BENCHMARK_DISPLAY_NAMES = {
+    name: f"{name} ({description})" for name, description in BENCHMARK_DESCRIPTIONS.items()
+}
+
+
+# Memory benchmarks (21-26), matched on the "NN_" prefix of the benchmark name
+MEMORY_BENCHMARK_PREFIXES = frozenset({"21_", "22_", "23_", "24_", "25_", "26_"})
+
+
 def is_memory_benchmark(name: str) -> bool:
     """Check if a benchmark name corresponds to a memory benchmark."""
-    return name.startswith(("21_", "22_", "23_", "24_", "25_", "26_"))
+    return name[:3] in MEMORY_BENCHMARK_PREFIXES
 
 
-def convert_to_benchmark_format(results: list[dict], memory_only: bool = False) -> list[dict]:
+def partition_results(results: list[dict]) -> tuple[list[dict], list[dict]]:
+    """Split parsed results into (cpu, memory) lists in a single pass."""
+    cpu, memory = [], []
+    for result in results:
+        (memory if is_memory_benchmark(result["name"]) else cpu).append(result)
+    return cpu, memory
+
+
+def convert_to_benchmark_format(results: list[dict], unit: str) -> list[dict]:
     """
     Convert results to github-action-benchmark customSmallerIsBetter format.
 
@@ -114,57 +161,22 @@ def convert_to_benchmark_format(results: list[dict], memory_only: bool = False)
     Each benchmark gets its own trend line in gh-pages.
 
     Args:
-        results: Parsed benchmark results.
-        memory_only: If True, only include memory benchmarks (21-26) with MB unit.
-                     If False, only include CPU benchmarks (01-09) with ms unit.
+        results: Parsed benchmark results of one kind, as split by partition_results.
+        unit: "MB" for memory benchmarks (21-26), "ms" for CPU benchmarks (01-09).
     """
-    # Human-readable descriptions for all benchmarks
-    benchmark_descriptions = {
-        # CPU benchmarks (01-09)
-        "01_run1k": "create 1000 rows",
-        "02_replace1k": "replace all 1000 rows",
-        "03_update10th1k": "update every 10th row",
-        "04_select1k": "select row",
-        "05_swap1k": "swap two rows",
-        "06_remove-one-1k": "remove one row",
-        "07_create10k": "create 10,000 rows",
-        "08_create1k-after1k_x2": "append 1000 rows",
-        "09_clear1k": "clear all rows",
-        # Memory benchmarks (21-26)
-        "21_ready-memory": "ready memory",
-        "22_run-memory": "run memory",
-        "23_update5-memory": "update5 memory",
-        "24_replace5-memory": "replace5 memory",
-        "25_clear-memory": "clear memory",
-        "26_run-clear-memory": "run-clear memory",
-        # Startup benchmarks (31-34)
-        "31_startup-ci": "startup time",
-        "32_startup-bt": "script bootup time",
-        "33_startup-mainthreadcost": "main thread work cost",
-        "34_startup-totalbytes": "total byte weight",
-    }
-
-    unit = "MB" if memory_only else "ms"
     benchmark_results = []
+    # The unit is fixed per call, so bake it into the template once
+    extra_template = "mean: %.1f" + unit + ", samples: %d"
 
     for result in results:
         name = result["name"]
-        is_mem = is_memory_benchmark(name)
-
-        # Filter: only include memory benchmarks if memory_only, else only CPU
-        if memory_only and not is_mem:
-            continue
-        if not memory_only and is_mem:
-            continue
-
-        description = benchmark_descriptions.get(name, "")
-        display_name = f"{name} ({description})" if description else name
+        display_name = BENCHMARK_DISPLAY_NAMES.get(name, name)
 
         benchmark_results.append({
             "name": display_name,
             "unit": unit,
             "value": result["median"],
-            "extra": f"mean: {result['mean']:.1f}{unit}, samples: {len(result['values'])}"
+            "extra": extra_template % (result["mean"], result["samples"])
         })
 
     return benchmark_results
@@ -211,11 +223,7 @@ def main():
     print(f"Found {len(result_files)} result files")
 
     # Parse results
-    results = []
-    for file_path in result_files:
-        result = parse_result_file(file_path)
-        if result:
-            results.append(result)
+    results = [result for result in parse_result_files(parse_result_file, result_files) if result]
 
     if not results:
         print("❌ No valid results parsed")
@@ -223,34 +231,38 @@ def main():
 
     print(f"Parsed {len(results)} benchmark results")
 
+    cpu_results, memory_results = partition_results(results)
+
     # Convert CPU benchmarks (01-09) to benchmark format
-    cpu_data = convert_to_benchmark_format(results, memory_only=False)
+    cpu_data = convert_to_benchmark_format(cpu_results, "ms")
 
     # Write CPU output
     args.output.parent.mkdir(parents=True, exist_ok=True)
-    with open(args.output, "w") as f:
-        json.dump(cpu_data, f, indent=2)
+    dump_json(args.output, cpu_data, compact=True)
 
     print(f"✅ Wrote {len(cpu_data)} CPU results to {args.output}")
 
     # Write memory output if requested
     if args.output_memory:
-        memory_data = convert_to_benchmark_format(results, memory_only=True)
+        memory_data = convert_to_benchmark_format(memory_results, "MB")
         if memory_data:
             args.output_memory.parent.mkdir(parents=True, exist_ok=True)
-            with open(args.output_memory, "w") as f:
-                json.dump(memory_data, f, indent=2)
+            dump_json(args.output_memory, memory_data, compact=True)
             print(f"✅ Wrote {len(memory_data)} memory results to {args.output_memory}")
         else:
             print("⚠️  No memory benchmarks found in results")
 
-    # Print summary
-    print("\n## E2E Benchmark Results\n")
-    print("| Benchmark | Median | Mean | Unit |")
-    print("|-----------|--------|------|------|")
-    for result in sorted(results, key=lambda r: r["name"]):
+    # Print summary (the outputs are written, so results can be sorted in place)
+    results.sort(key=itemgetter("name"))
+    lines = [
+        "\n## E2E Benchmark Results\n",
+        "| Benchmark | Median | Mean | Unit |",
+        "|-----------|--------|------|------|",
+    ]
+    for result in results:
         unit = "MB" if is_memory_benchmark(result["name"]) else "ms"
-        print(f"| {result['name']} | {result['median']:.1f}{unit} | {result['mean']:.1f}{unit} | {unit} |")
+        lines.append(f"| {result['name']} | {result['median']:.1f}{unit} | {result['mean']:.1f}{unit} | {unit} |")
+    print("\n".join(lines))
 
 
 if __name__ == "__main__":
@@ -9,15 +9,14 @@ Usage:
     python extract-allocations.py <input.json> <output.json>
 """
 
-import json
 import sys
-from pathlib import Path
+
+from _json_io import dump_json, load_json
 
 
 def extract_allocations(input_path: str, output_path: str) -> None:
     """Extract BytesAllocatedPerOperation from BenchmarkDotNet JSON."""
-    with open(input_path, 'r') as f:
-        data = json.load(f)
+    data = load_json(input_path)
 
     results = []
     for benchmark in data.get('Benchmarks', []):
@@ -53,8 +52,8 @@ def extract_allocations(input_path: str, output_path: str) -> None:
         
         results.append(result)
     
-    with open(output_path, 'w') as f:
-        json.dump(results, f, indent=2)
+    # Only read by github-action-benchmark, so it is not indented
+    dump_json(output_path, results, compact=True)
     
     print(f"Extracted {len(results)} allocation metrics to {output_path}")
     for r in results:
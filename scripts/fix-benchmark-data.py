@@ -11,24 +11,25 @@ This resulted in two separate chart sets - the old ones stopped receiving update
 Solution: Merge the old entries into the new chart sets, sorted by date.
 """
 
-import json
 import sys
 from pathlib import Path
 
+from _json_io import decode_json, encode_json
+
+# JavaScript wrapper around the JSON document in gh-pages data.js
+DATA_JS_PREFIX = b"window.BENCHMARK_DATA = "
+
 
 def fix_benchmark_data(input_file: str, output_file: str) -> None:
     """Read the benchmark data, merge old names into new names, and write output."""
     
-    # Read the data.js file
-    content = Path(input_file).read_text()
+    # Read the data.js file as bytes; the JSON decoder handles UTF-8 itself
+    content = Path(input_file).read_bytes()
     
     # Remove the JavaScript wrapper
-    if content.startswith("window.BENCHMARK_DATA = "):
-        json_str = content.replace("window.BENCHMARK_DATA = ", "", 1)
-    else:
-        json_str = content
+    json_bytes = content.removeprefix(DATA_JS_PREFIX)
     
-    data = json.loads(json_str)
+    data = decode_json(json_bytes)
     
     entries = data.get("entries", {})
     
@@ -38,41 +39,47 @@ def fix_benchmark_data(input_file: str, output_file: str) -> None:
         "Virtual DOM Allocations": "Rendering Engine Allocations",
     }
     
+    # Names whose lists received old entries and need re-sorting
+    merged_names = set()
+    
     # Merge old entries into new entries
     for old_name, new_name in name_mapping.items():
         if old_name in entries:
             old_entries = entries[old_name]
             
             # Get or create the new entries list
-            if new_name not in entries:
-                entries[new_name] = []
+            new_entries = entries.setdefault(new_name, [])
             
             # Get existing commit IDs to avoid duplicates
-            existing_ids = {e["commit"]["id"] for e in entries[new_name] if "commit" in e and "id" in e["commit"]}
+            existing_ids = {e["commit"]["id"] for e in new_entries if "commit" in e and "id" in e["commit"]}
             
-            # Add old entries that aren't duplicates
+            # Add old entries that aren't duplicates, keeping the first entry per commit ID
+            unique_old = {}
             for entry in old_entries:
                 commit_id = entry.get("commit", {}).get("id", "")
                 if commit_id and commit_id not in existing_ids:
-                    entries[new_name].append(entry)
-                    existing_ids.add(commit_id)
+                    unique_old.setdefault(commit_id, entry)
+            new_entries.extend(unique_old.values())
             
             # Remove the old entry
             del entries[old_name]
+            merged_names.add(new_name)
             
             print(f"Merged {len(old_entries)} entries from '{old_name}' into '{new_name}'")
     
-    # Sort each entry list by date
-    for name in entries:
+    # Sort the merged entry lists by date; the action appends the others in date order already
+    for name in merged_names:
         entries[name].sort(key=lambda e: e.get("date", 0))
+    
+    for name in entries:
         print(f"'{name}': {len(entries[name])} total entries")
     
     data["entries"] = entries
     
     # Write the output with the JavaScript wrapper
     # Use ensure_ascii=False to preserve ± symbols without escaping
-    output_content = "window.BENCHMARK_DATA = " + json.dumps(data, indent=2, ensure_ascii=False)
-    Path(output_file).write_text(output_content, encoding='utf-8')
+    output_content = DATA_JS_PREFIX + encode_json(data, ensure_ascii=False)
+    Path(output_file).write_bytes(output_content)
     
     print(f"\nFixed data written to: {output_file}")
 
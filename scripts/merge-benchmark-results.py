@@ -22,45 +22,52 @@ Output:
         allocations.json  - customSmallerIsBetter format for memory allocations
 """
 
-import json
 import os
 import sys
 from pathlib import Path
 from datetime import datetime
 
+from _json_io import dump_json, load_json
+
 
 def find_benchmark_files(base_dir: Path) -> dict[str, Path]:
     """Find all benchmark JSON files in the results directory."""
     files = {}
     for suite in ['diffing', 'rendering', 'handlers']:
         suite_dir = base_dir / suite / 'results'
-        if suite_dir.exists():
-            for f in suite_dir.glob('*-report-full-compressed.json'):
-                files[suite] = f
-                break
+        if not suite_dir.is_dir():
+            continue
+        # One directory listing per suite; stop at the first full report
+        with os.scandir(suite_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith('-report-full-compressed.json'):
+                    files[suite] = Path(entry.path)
+                    break
     return files
 
 
 def load_benchmark_data(file_path: Path) -> dict:
     """Load and parse BenchmarkDotNet JSON file."""
-    with open(file_path, 'r') as f:
-        return json.load(f)
+    return load_json(file_path)
 
 
 def extract_throughput_metrics(data: dict, suite_prefix: str) -> list[dict]:
-    """Extract throughput metrics in BenchmarkDotNet format."""
+    """Extract throughput metrics in BenchmarkDotNet format.
+
+    Renames the benchmarks in data in place, so extract anything else that needs
+    the original names first.
+    """
     benchmarks = []
     for benchmark in data.get('Benchmarks', []):
         # Get the method name and add suite prefix
         method = benchmark.get('Method', 'Unknown')
         full_name = f"{suite_prefix}/{method}"
         
-        # Copy the benchmark with modified name
-        modified = benchmark.copy()
-        modified['Method'] = full_name
-        modified['FullName'] = f"Abies.Benchmarks.{full_name}"
+        # Rename in place; the report is discarded after extraction
+        benchmark['Method'] = full_name
+        benchmark['FullName'] = f"Abies.Benchmarks.{full_name}"
         
-        benchmarks.append(modified)
+        benchmarks.append(benchmark)
     
     return benchmarks
 
@@ -151,30 +158,30 @@ def main():
         data = load_benchmark_data(path)
         prefix = suite_prefixes.get(suite, suite.title())
         
-        # Save template for merged output
+        # Save template for merged output; keep only the subtree it reads so the
+        # rest of the first report can be freed once its metrics are extracted
         if template_data is None:
-            template_data = data
+            template_data = {"HostEnvironmentInfo": data.get("HostEnvironmentInfo", {})}
         
-        # Extract metrics
-        throughput = extract_throughput_metrics(data, prefix)
+        # Extract metrics (allocations first: throughput extraction renames in place)
         allocations = extract_allocation_metrics(data, prefix)
+        throughput = extract_throughput_metrics(data, prefix)
         
         all_throughput.extend(throughput)
         all_allocations.extend(allocations)
         
         print(f"  Extracted {len(throughput)} throughput and {len(allocations)} allocation metrics from {suite}")
     
-    # Write merged throughput (BenchmarkDotNet format)
+    # Write merged throughput (BenchmarkDotNet format). Both merged files are only read
+    # by tools (github-action-benchmark, compare-benchmarks.py), so they are not indented.
     throughput_file = output_dir / 'throughput.json'
     merged_throughput = merge_benchmarkdotnet_format(all_throughput, template_data or {})
-    with open(throughput_file, 'w') as f:
-        json.dump(merged_throughput, f, indent=2)
+    dump_json(throughput_file, merged_throughput, compact=True)
     print(f"\nWrote {len(all_throughput)} throughput metrics to {throughput_file}")
     
     # Write merged allocations (customSmallerIsBetter format)
     allocations_file = output_dir / 'allocations.json'
-    with open(allocations_file, 'w') as f:
-        json.dump(all_allocations, f, indent=2)
+    dump_json(allocations_file, all_allocations, compact=True)
     print(f"Wrote {len(all_allocations)} allocation metrics to {allocations_file}")
     
     # Print summary
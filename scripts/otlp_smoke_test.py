@@ -1,10 +1,11 @@
 #!/usr/bin/env python3
 
+import http.client
 import os
+import socket
 import sys
 import time
-import urllib.error
-import urllib.request
+import urllib.parse
 
 
 def main() -> int:
@@ -15,74 +16,72 @@ def main() -> int:
     # validate proxy routing/auth/CORS doesn't 403/415 before we send real data.
     payload = bytes([0x0A, 0x00])
 
-    def is_reachable(url: str) -> bool:
+    target = urllib.parse.urlsplit(api_proxy_url)
+    address = (target.hostname, target.port or (443 if target.scheme == "https" else 80))
+
+    def is_reachable() -> bool:
         # OTLP endpoints generally don't support GET; we only need to know the TCP listener is up.
-        # We'll try a POST with a tiny payload and treat any HTTP response as "reachable".
-        req = urllib.request.Request(
-            url,
-            data=payload,
-            headers={"Content-Type": "application/x-protobuf"},
-            method="POST",
-        )
+        # A plain connect answers that without an HTTP round trip; the POST below reports the status.
         try:
-            urllib.request.urlopen(req, timeout=2)
-            return True
-        except urllib.error.HTTPError:
-            return True
-        except Exception:
+            with socket.create_connection(address, timeout=2):
+                return True
+        except OSError:
             return False
 
     # Wait briefly for the API to be up (useful when launched by a task)
     deadline = time.time() + float(os.environ.get("ABIES_OTLP_WAIT_SECONDS", "8"))
-    while time.time() < deadline and not is_reachable(api_proxy_url):
+    while time.time() < deadline and not is_reachable():
         time.sleep(0.25)
 
-    if not is_reachable(api_proxy_url):
+    if not is_reachable():
         print("target", api_proxy_url)
         print("status", "unreachable")
         print("note", "The API proxy endpoint isn't reachable. Ensure Abies.Conduit.Api is running on port 5179.")
         return 2
 
-    req = urllib.request.Request(
-        api_proxy_url,
-        data=payload,
-        headers={"Content-Type": "application/x-protobuf"},
-        method="POST",
-    )
+    # A single POST to a known endpoint doesn't need urllib's opener/handler chain
+    connection_class = http.client.HTTPSConnection if target.scheme == "https" else http.client.HTTPConnection
+    path = target.path or "/"
+    if target.query:
+        path = f"{path}?{target.query}"
 
+    conn = connection_class(*address, timeout=5)
     try:
-        resp = urllib.request.urlopen(req, timeout=5)
-        body = resp.read()
-        print("target", api_proxy_url)
-        print("status", resp.status)
-        print("content-type", resp.headers.get("content-type"))
-        print("x-otlp-proxy-has-key", resp.headers.get("x-otlp-proxy-has-key"))
-        print("x-otlp-proxy-key-sha256", resp.headers.get("x-otlp-proxy-key-sha256"))
-        print("body_len", len(body))
-        print(
-            "note",
-            "If status is 202 in Development, proxy likely couldn't forward downstream but accepted payload.",
-        )
-        print("hint", f"For deeper debugging, compare with direct Aspire OTLP: {aspire_otlp_url}")
-        return 0
-    except urllib.error.HTTPError as e:
-        body = e.read()
+        conn.request("POST", path, body=payload, headers={"Content-Type": "application/x-protobuf"})
+        resp = conn.getresponse()
+        # Only the body's size is reported; take it from Content-Length and
+        # read the body just when the length isn't declared (chunked responses)
+        body_len = resp.length if resp.length is not None else len(resp.read())
+    except Exception as e:
         print("target", api_proxy_url)
-        print("status", e.code)
-        print("content-type", e.headers.get("content-type"))
-        print("x-otlp-proxy-has-key", e.headers.get("x-otlp-proxy-has-key"))
-        print("x-otlp-proxy-key-sha256", e.headers.get("x-otlp-proxy-key-sha256"))
-        print("body_len", len(body))
+        print("status", "error")
+        print("exception", f"{type(e).__name__}: {e}")
+        return 3
+    finally:
+        conn.close()
+
+    print("target", api_proxy_url)
+    print("status", resp.status)
+    print("content-type", resp.headers.get("content-type"))
+    print("x-otlp-proxy-has-key", resp.headers.get("x-otlp-proxy-has-key"))
+    print("x-otlp-proxy-key-sha256", resp.headers.get("x-otlp-proxy-key-sha256"))
+    print("body_len", body_len)
+
+    # Any non-2xx status fails, redirects included: a redirect (e.g. to a login page) is the kind of
+    # routing/auth misconfiguration this test is for. urllib used to follow 301/302/303 as a GET instead.
+    if not 200 <= resp.status < 300:
         print(
             "note",
             "If status is 401/403, Aspire dashboard likely requires x-otlp-api-key and proxy didn't forward it.",
         )
         return 1
-    except Exception as e:
-        print("target", api_proxy_url)
-        print("status", "error")
-        print("exception", f"{type(e).__name__}: {e}")
-        return 3
+
+    print(
+        "note",
+        "If status is 202 in Development, proxy likely couldn't forward downstream but accepted payload.",
+    )
+    print("hint", f"For deeper debugging, compare with direct Aspire OTLP: {aspire_otlp_url}")
+    return 0
 
 
 if __name__ == "__main__":
@@ -21,6 +21,7 @@ import argparse
 import json
 import math
 import re
+import statistics
 import sys
 from pathlib import Path
 
@@ -102,15 +103,13 @@ def parse_result_file(file_path: Path) -> dict | None:
                 if not values:
                     print(f"Warning: Missing or empty values for median in {file_path}", file=sys.stderr)
                     return None
-                sorted_values = sorted(values)
-                median = sorted_values[len(sorted_values) // 2]
+                median = statistics.median(values)
         else:
             values = values_obj if isinstance(values_obj, list) else []
             if not values:
                 print(f"Warning: Missing or empty values for median in {file_path}", file=sys.stderr)
                 return None
-            sorted_values = sorted(values)
-            median = sorted_values[len(sorted_values) // 2]
+            median = statistics.median(values)
 
         # Reject invalid or non-positive medians to avoid log(0) / bad stats later.
         if not isinstance(median, (int, float)) or median <= 0: